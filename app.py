@@ -1,13 +1,86 @@
 import streamlit as st
 import re
 import io
+import itertools
+import hashlib
+import mimetypes
+import shutil
 import zipfile
-from PIL import Image
+import subprocess
+import tempfile
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from PIL import Image, ImageOps
 import pytesseract
 import os
 
+# Images are OCRed in parallel, so each tesseract engine must not start its own OpenMP thread team
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
 st.set_page_config(page_title="Image Renaming Tool", page_icon="🖼️")
 
+# sched_getaffinity counts only the CPUs this process may run on (e.g. a container cpuset), where available
+MAX_WORKERS = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+OCR_BATCH_SIZE = 8
+OCR_MAX_SIZE = (1600, 1600)
+OCR_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pilgrim_ocr")
+# Bump when prepare_for_ocr or the OCR settings change so stale cached text is not reused
+OCR_CACHE_VERSION = 1
+OCR_CACHE_MAX_ENTRIES = 5000
+ZIP_FILENAME = "renamed_images.zip"
+IMAGE_SIGNATURES = (b'\x89PNG\r\n\x1a\n', b'\xff\xd8\xff')
+# Product names sit near the top of a label; only the fallback strategy looks further down
+NAME_LINES = 25
+FALLBACK_LINES = 50
+# Only pages at least this many times taller than wide are OCRed as strips
+TILE_MIN_ASPECT = 2
+TILE_OVERLAP_RATIO = 0.1
+PROGRESS_INTERVAL = 0.1
+
+PRODUCT_KEYWORDS = ['oil', 'serum', 'cream', 'foundation', 'lotion', 'gel',
+                    'moisturizer', 'cleanser', 'toner', 'essence', 'mask',
+                    'balm', 'primer', 'powder', 'lipstick', 'mascara']
+EXCLUDE_PHRASES = ['was evaluated', 'tested', 'description', 'ingredients',
+                   'how to use', 'directions', 'warning', 'caution']
+TRIGGER_PHRASES = ['was evaluated', 'tested for', 'test results']
+HEADER_WORDS = ['report', 'test', 'analysis', 'certificate']
+
+def compile_phrases(phrases):
+    """Compile a list of literal phrases into one case-insensitive alternation pattern."""
+    return re.compile("|".join(re.escape(phrase) for phrase in phrases), re.IGNORECASE)
+
+PRODUCT_KEYWORDS_RE = compile_phrases(PRODUCT_KEYWORDS)
+EXCLUDE_PHRASES_RE = compile_phrases(EXCLUDE_PHRASES)
+TRIGGER_PHRASES_RE = compile_phrases(TRIGGER_PHRASES)
+HEADER_WORDS_RE = compile_phrases(HEADER_WORDS)
+BY_FROM_RE = re.compile(r'\bby\b|\bfrom\b', re.IGNORECASE)
+# Yields each non-blank line already stripped, so no per-line strip() or emptiness check is needed
+LINE_RE = re.compile(r"[^\S\n]*(\S(?:[^\n]*\S)?)")
+# Underscores are part of the run so existing ones collapse with replaced characters
+SANITIZE_RE = re.compile(r"[^a-zA-Z0-9&-]+")
+
+@st.cache_resource
+def get_tess_apis():
+    """Return the server-wide pool of idle tesserocr APIs, kept so loaded language models survive reruns."""
+    return queue.Queue()
+
+tess_apis = get_tess_apis()
+
+@st.cache_resource
+def get_ocr_slots():
+    """Return the server-wide semaphore that caps concurrently running OCR engines."""
+    return threading.BoundedSemaphore(MAX_WORKERS)
+
+ocr_slots = get_ocr_slots()
+
 # Initialize session state
 if 'processed_images' not in st.session_state:
     st.session_state.processed_images = []
@@ -15,56 +88,133 @@ if 'failed_count' not in st.session_state:
     st.session_state.failed_count = 0
 if 'processing_complete' not in st.session_state:
     st.session_state.processing_complete = False
+if 'first_error' not in st.session_state:
+    st.session_state.first_error = None
+if 'work_dir' not in st.session_state:
+    st.session_state.work_dir = tempfile.TemporaryDirectory()
 
 def clean_text(text):
     """Clean and sanitize text for use as filename."""
-    text = text.strip().replace("\n", " ")
-    text = re.sub(r"[^a-zA-Z0-9_&-]", "_", text)
-    text = re.sub(r"_+", "_", text)
-    text = text.strip("_")
-    return text[:80]
+    # Whitespace and newlines are disallowed characters, so the substitution already handles them
+    return SANITIZE_RE.sub("_", text).strip("_")[:80]
 
 def extract_product_name(text):
-    """Extract product name from OCR text using multiple strategies."""
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    """Extract product name from the top lines of OCR text using multiple strategies in one pass."""
+    lines = list(itertools.islice((match.group(1) for match in LINE_RE.finditer(text)), FALLBACK_LINES))
+    trigger_match = by_from_match = fallback_match = None
     
-    product_keywords = ['oil', 'serum', 'cream', 'foundation', 'lotion', 'gel', 
-                       'moisturizer', 'cleanser', 'toner', 'essence', 'mask',
-                       'balm', 'primer', 'powder', 'lipstick', 'mascara']
-    
-    for i, line in enumerate(lines):
-        line_lower = line.lower()
-        if any(keyword in line_lower for keyword in product_keywords):
-            exclude_phrases = ['was evaluated', 'tested', 'description', 'ingredients', 
-                             'how to use', 'directions', 'warning', 'caution']
-            if not any(phrase in line_lower for phrase in exclude_phrases):
-                if 5 < len(line) < 100:
-                    return line
-    
-    trigger_phrases = ['was evaluated', 'tested for', 'test results']
     for i, line in enumerate(lines):
-        line_lower = line.lower()
-        if any(phrase in line_lower for phrase in trigger_phrases) and i > 0:
-            prev_line = lines[i-1]
-            if len(prev_line) > 5:
-                return prev_line
-    
-    for line in lines:
-        if re.search(r'\bby\b|\bfrom\b', line, re.IGNORECASE):
-            if len(line) > 5 and len(line) < 100:
+        # Past the top lines only the fallback can still change the result
+        if i >= NAME_LINES and (trigger_match or by_from_match or fallback_match):
+            break
+        
+        length = len(line)
+        if i < NAME_LINES:
+            # A keyword line outranks every other strategy, so it can be returned straight away
+            if 5 < length < 100 and PRODUCT_KEYWORDS_RE.search(line) and not EXCLUDE_PHRASES_RE.search(line):
                 return line
+            if trigger_match is None and i > 0 and len(lines[i-1]) > 5 and TRIGGER_PHRASES_RE.search(line):
+                trigger_match = lines[i-1]
+            if by_from_match is None and 5 < length < 100 and BY_FROM_RE.search(line):
+                by_from_match = line
+        
+        if fallback_match is None and 10 < length < 100 and not HEADER_WORDS_RE.search(line):
+            fallback_match = line
     
-    for line in lines:
-        if len(line) > 10 and len(line) < 100:
-            if not any(header in line.lower() for header in ['report', 'test', 'analysis', 'certificate']):
-                return line
+    return trigger_match or by_from_match or fallback_match
+
+def prepare_for_ocr(image):
+    """Convert an image to contrast-stretched grayscale no larger than OCR_MAX_SIZE."""
+    # Lets JPEGs decode straight to grayscale at a reduced scale; a no-op for other formats.
+    # draft() scales by the smaller of the two axis ratios, so it needs the aspect-fitted target size.
+    scale = min(1.0, OCR_MAX_SIZE[0] / image.width, OCR_MAX_SIZE[1] / image.height)
+    image.draft("L", (max(1, round(image.width * scale)), max(1, round(image.height * scale))))
+    image = image.convert("L")
+    if max(image.size) > max(OCR_MAX_SIZE):
+        image.thumbnail(OCR_MAX_SIZE, Image.BILINEAR)
+    return ImageOps.autocontrast(image)
+
+@contextmanager
+def checkout_tess_api():
+    """Borrow an idle tesserocr API from the shared pool, loading a new one if none is free."""
+    try:
+        api = tess_apis.get_nowait()
+    except queue.Empty:
+        api = tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.AUTO)
+    try:
+        yield api
+    finally:
+        tess_apis.put(api)
+
+def ocr_images(images):
+    """Return the OCR text of each image, in-process when tesserocr is available."""
+    # Whole pages and strips from every session share these slots, so at most MAX_WORKERS
+    # engines run at once and at most MAX_WORKERS tesserocr models are ever loaded
+    with ocr_slots:
+        if tesserocr is None:
+            return ocr_images_cli(images)
+        
+        texts = []
+        with checkout_tess_api() as api:
+            for image in images:
+                api.SetImage(image)
+                texts.append(api.GetUTF8Text())
+        return texts
+
+def ocr_images_cli(images):
+    """Run a single tesseract process over several images and return the text of each."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        image_paths = []
+        for idx, image in enumerate(images):
+            # Uncompressed PGM is the cheapest format to write and for tesseract to read back
+            image_path = os.path.join(tmpdir, f"{idx}.pgm")
+            image.save(image_path, format='PPM')
+            image_paths.append(image_path)
+        
+        list_path = os.path.join(tmpdir, "filelist.txt")
+        with open(list_path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(image_paths))
+        
+        output_base = os.path.join(tmpdir, "output")
+        result = subprocess.run(
+            [pytesseract.pytesseract.tesseract_cmd, list_path, output_base, "-l", "eng", "txt"],
+            capture_output=True,
+            env={**os.environ, "OMP_THREAD_LIMIT": "1"}
+        )
+        if result.returncode != 0:
+            stderr = result.stderr.decode('utf-8', errors='replace').strip()
+            raise RuntimeError(f"tesseract exited with code {result.returncode}: {stderr}")
+        
+        with open(f"{output_base}.txt", encoding='utf-8') as f:
+            pages = f.read().split("\x0c")
+    
+    # Tesseract versions differ on whether the page separator also follows the last page
+    if len(pages) == len(images) + 1 and not pages[-1].strip():
+        pages.pop()
+    if len(pages) != len(images):
+        raise RuntimeError(f"Expected OCR text for {len(images)} images, got {len(pages)}")
+    return pages
+
+def ocr_with_retry(images):
+    """OCR images in one call, retrying one at a time if it fails; returns a (text, error) pair per image."""
+    if not images:
+        return []
+    try:
+        return [(text, None) for text in ocr_images(images)]
+    except Exception:
+        pass
     
-    return None
+    results = []
+    for image in images:
+        try:
+            results.append((ocr_images([image])[0], None))
+        except Exception as e:
+            results.append((None, e))
+    return results
 
-def process_image(image, original_filename):
-    """Process a single image and return new filename and image bytes."""
+def process_image(image_bytes, original_filename, text):
+    """Process a single image from its OCR text and return new filename and original image bytes."""
     try:
-        text = pytesseract.image_to_string(image)
         product_name = extract_product_name(text)
         
         if not product_name:
@@ -78,19 +228,177 @@ def process_image(image, original_filename):
         file_extension = original_filename.split('.')[-1]
         new_filename = f"{clean_name}.{file_extension}"
         
-        img_byte_arr = io.BytesIO()
-        image.save(img_byte_arr, format=image.format or 'PNG')
-        img_byte_arr.seek(0)
-        
-        return new_filename, img_byte_arr.getvalue()
+        return new_filename, image_bytes
     
-    except Exception as e:
+    except Exception:
         return None, None
 
+def is_supported_image(image_bytes):
+    """Check for a PNG or JPEG signature so other files are rejected before decoding."""
+    return image_bytes.startswith(IMAGE_SIGNATURES)
+
+def cache_key(digest, tiled=False):
+    """Return the cache key for an image digest under the current OCR pipeline."""
+    engine = "tesserocr" if tesserocr is not None else "cli"
+    layout = "tiled" if tiled else "page"
+    return f"{digest}-v{OCR_CACHE_VERSION}-{engine}-{layout}"
+
+def load_cached_text(key):
+    """Return cached OCR text for a cache key, or None on a cache miss."""
+    cache_path = os.path.join(OCR_CACHE_DIR, f"{key}.txt")
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            text = f.read()
+    except OSError:
+        return None
+    
+    # Refresh the timestamp so pruning evicts the least recently used entries; a read-only cache still hits
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+    return text
+
+def store_cached_text(key, text):
+    """Cache OCR text under a cache key, ignoring filesystem errors."""
+    cache_path = os.path.join(OCR_CACHE_DIR, f"{key}.txt")
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(OCR_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # The pruner only looks at .txt entries, so a failed write must not leave its temp file behind
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+def cache_entry_mtime(entry):
+    """Return a cache entry's modification time, or 0 if it has disappeared."""
+    try:
+        return entry.stat().st_mtime
+    except OSError:
+        return 0
+
+def prune_ocr_cache():
+    """Delete the least recently used cache entries beyond OCR_CACHE_MAX_ENTRIES."""
+    try:
+        entries = [entry for entry in os.scandir(OCR_CACHE_DIR) if entry.name.endswith(".txt")]
+    except OSError:
+        return
+    if len(entries) <= OCR_CACHE_MAX_ENTRIES:
+        return
+    
+    entries.sort(key=cache_entry_mtime)
+    for entry in entries[:len(entries) - OCR_CACHE_MAX_ENTRIES]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+def should_tile(image):
+    """Return True for pages so tall that downscaling them whole would shrink their text."""
+    # Strips are OCRed in-process; with the CLI each strip would pay tesseract's startup again
+    return (
+        tesserocr is not None
+        and image.height > OCR_MAX_SIZE[1]
+        and image.height >= TILE_MIN_ASPECT * image.width
+    )
+
+def split_into_strips(image):
+    """Split a tall image into overlapping, roughly square horizontal strips, at most one per worker."""
+    count = min(MAX_WORKERS, -(-image.height // image.width))
+    step = -(-image.height // count)
+    overlap = int(step * TILE_OVERLAP_RATIO)
+    return [
+        image.crop((0, max(0, top - overlap), image.width, min(image.height, top + step + overlap)))
+        for top in range(0, image.height, step)
+    ]
+
+def ocr_tiled(image, tile_executor):
+    """OCR the strips of a tall image in parallel and join their text in page order."""
+    strips = [prepare_for_ocr(strip) for strip in split_into_strips(image)]
+    return "\n".join(tile_executor.map(lambda strip: ocr_images([strip])[0], strips))
+
+def process_batch(batch_files, tile_executor):
+    """Process a batch of uploaded files, OCRing only uncached images; returns per-file results and the first error."""
+    batch = [(uploaded_file.getvalue(), uploaded_file.name) for uploaded_file in batch_files]
+    errors = [None] * len(batch)
+    
+    # Opening an image only reads its header, which is enough to pick the OCR path and cache key
+    opened = []
+    keys = []
+    for idx, (image_bytes, _) in enumerate(batch):
+        image = key = None
+        if not is_supported_image(image_bytes):
+            errors[idx] = ValueError("not a PNG or JPEG file")
+        else:
+            try:
+                image = Image.open(io.BytesIO(image_bytes))
+                key = cache_key(hashlib.sha256(image_bytes).hexdigest(), tiled=should_tile(image))
+            except Exception as e:
+                image = None
+                errors[idx] = e
+        opened.append(image)
+        keys.append(key)
+    
+    texts = [load_cached_text(key) if key else None for key in keys]
+    missing = [idx for idx, text in enumerate(texts) if text is None and keys[idx]]
+    
+    # Decode each image on its own so one corrupt file does not fail the rest of the batch
+    whole_pages = {}
+    for idx in missing:
+        try:
+            if should_tile(opened[idx]):
+                texts[idx] = ocr_tiled(opened[idx], tile_executor)
+            else:
+                whole_pages[idx] = prepare_for_ocr(opened[idx])
+        except Exception as e:
+            errors[idx] = e
+    
+    for idx, (text, error) in zip(whole_pages, ocr_with_retry(list(whole_pages.values()))):
+        texts[idx] = text
+        errors[idx] = error
+    
+    for idx in missing:
+        if texts[idx] is not None:
+            store_cached_text(keys[idx], texts[idx])
+    
+    first_error = next(
+        (f"{filename}: {type(error).__name__}: {error}" for (_, filename), error in zip(batch, errors) if error),
+        None
+    )
+    results = [
+        process_image(image_bytes, filename, text) if text is not None else (None, None)
+        for (image_bytes, filename), text in zip(batch, texts)
+    ]
+    return results, first_error
+
+def unique_filename(filename, used_names):
+    """Return filename, or a numbered variant of it if it is already in used_names."""
+    if filename not in used_names:
+        used_names[filename] = 0
+        return filename
+    
+    base, ext = os.path.splitext(filename)
+    counter = used_names[filename]
+    while True:
+        counter += 1
+        candidate = f"{base}_{counter}{ext}"
+        if candidate not in used_names:
+            break
+    
+    used_names[filename] = counter
+    used_names[candidate] = 0
+    return candidate
+
 def reset_processing():
     """Reset processing state."""
     st.session_state.processed_images = []
     st.session_state.failed_count = 0
+    st.session_state.first_error = None
     st.session_state.processing_complete = False
 
 # Sidebar for Tesseract configuration
@@ -99,7 +407,7 @@ with st.sidebar:
     tesseract_path = st.text_input(
         "Tesseract Path (optional)",
         placeholder="C:\\Program Files\\Tesseract-OCR\\tesseract.exe",
-        help="Leave empty if Tesseract is in system PATH"
+        help="Leave empty if Tesseract is in system PATH. Only used when tesserocr is not installed."
     )
     
     if tesseract_path:
@@ -136,23 +444,69 @@ if uploaded_files and not st.session_state.processing_complete:
     if st.button("🚀 Process Images", type="primary"):
         st.session_state.processed_images = []
         st.session_state.failed_count = 0
+        st.session_state.first_error = None
         
         progress_bar = st.progress(0)
         status_text = st.empty()
         
-        for idx, uploaded_file in enumerate(uploaded_files):
-            status_text.text(f"Processing: {uploaded_file.name}")
-            
-            image = Image.open(uploaded_file)
-            new_filename, img_bytes = process_image(image, uploaded_file.name)
-            
-            if new_filename and img_bytes:
-                st.session_state.processed_images.append((new_filename, img_bytes))
-            else:
-                st.session_state.failed_count += 1
-            
-            progress_bar.progress((idx + 1) / len(uploaded_files))
+        # Workers copy each upload's bytes themselves, so a run holds only in-flight batches
+        files = list(uploaded_files)
+        # Batching only amortizes CLI startup, so tesserocr gets one image per task; either way every worker gets work
+        batch_size = 1 if tesserocr is not None else min(OCR_BATCH_SIZE, -(-len(files) // MAX_WORKERS))
+        batches = [files[i:i + batch_size] for i in range(0, len(files), batch_size)]
+        zip_path = os.path.join(st.session_state.work_dir.name, ZIP_FILENAME)
+        images_dir = os.path.join(st.session_state.work_dir.name, "images")
+        shutil.rmtree(images_dir, ignore_errors=True)
+        os.makedirs(images_dir)
+        used_names = {}
+        pending = {}
+        next_batch = 0
+        done = 0
+        last_update = time.monotonic()
         
+        # tesserocr releases the GIL and the CLI fallback runs in subprocesses, so threads keep every core busy.
+        # Each run gets its own pools so one session's upload never queues behind another's.
+        executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="ocr")
+        tile_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="ocr-tile")
+        try:
+            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED) as zip_file:
+                futures = {executor.submit(process_batch, batch, tile_executor): idx for idx, batch in enumerate(batches)}
+                for future in as_completed(futures):
+                    idx = futures[future]
+                    pending[idx], error = future.result()
+                    if error and st.session_state.first_error is None:
+                        st.session_state.first_error = error
+                    
+                    # Add finished batches to the ZIP in upload order while later batches are still in OCR
+                    while next_batch in pending:
+                        for new_filename, img_bytes in pending.pop(next_batch):
+                            if new_filename and img_bytes:
+                                new_filename = unique_filename(new_filename, used_names)
+                                image_path = os.path.join(images_dir, new_filename)
+                                with open(image_path, 'wb') as f:
+                                    f.write(img_bytes)
+                                zip_file.write(image_path, new_filename)
+                                st.session_state.processed_images.append((new_filename, image_path))
+                            else:
+                                st.session_state.failed_count += 1
+                        next_batch += 1
+                    
+                    done += len(batches[idx])
+                    # Each update is a round-trip to the browser, so refresh at most every PROGRESS_INTERVAL
+                    now = time.monotonic()
+                    if now - last_update >= PROGRESS_INTERVAL:
+                        status_text.text(f"Processed: {batches[idx][-1].name}")
+                        progress_bar.progress(done / len(files))
+                        last_update = now
+        except BaseException:
+            # Streamlit stops or reruns the script by raising at the next st.* call; drop queued OCR work without waiting
+            executor.shutdown(wait=False, cancel_futures=True)
+            tile_executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+        tile_executor.shutdown()
+        
+        prune_ocr_cache()
         progress_bar.empty()
         status_text.empty()
         st.session_state.processing_complete = True
@@ -168,6 +522,8 @@ if st.session_state.processing_complete:
             st.metric("✅ Passed", len(st.session_state.processed_images))
         with col2:
             st.metric("❌ Failed", st.session_state.failed_count)
+        if st.session_state.first_error:
+            st.caption(f"First error: {st.session_state.first_error}")
         
         st.divider()
         
@@ -175,37 +531,25 @@ if st.session_state.processing_complete:
         st.subheader("📥 Download Results")
         
         if len(st.session_state.processed_images) == 1:
-            st.download_button(
-                label="⬇️ Download Renamed Image",
-                data=st.session_state.processed_images[0][1],
-                file_name=st.session_state.processed_images[0][0],
-                mime="image/png",
-                use_container_width=True
-            )
+            filename, image_path = st.session_state.processed_images[0]
+            with open(image_path, 'rb') as image_data:
+                st.download_button(
+                    label="⬇️ Download Renamed Image",
+                    data=image_data,
+                    file_name=filename,
+                    mime=mimetypes.guess_type(filename)[0] or "image/png",
+                    use_container_width=True
+                )
         else:
-            # Create ZIP file
-            zip_buffer = io.BytesIO()
-            with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                used_names = {}
-                for filename, img_bytes in st.session_state.processed_images:
-                    if filename in used_names:
-                        used_names[filename] += 1
-                        name_parts = filename.rsplit('.', 1)
-                        filename = f"{name_parts[0]}_{used_names[filename]}.{name_parts[1]}"
-                    else:
-                        used_names[filename] = 0
-                    
-                    zip_file.writestr(filename, img_bytes)
-            
-            zip_buffer.seek(0)
-            
-            st.download_button(
-                label=f"⬇️ Download All as ZIP ({len(st.session_state.processed_images)} images)",
-                data=zip_buffer.getvalue(),
-                file_name="renamed_images.zip",
-                mime="application/zip",
-                use_container_width=True
-            )
+            # The ZIP was written during processing; JPEG/PNG payloads are stored uncompressed
+            with open(os.path.join(st.session_state.work_dir.name, ZIP_FILENAME), 'rb') as zip_data:
+                st.download_button(
+                    label=f"⬇️ Download All as ZIP ({len(st.session_state.processed_images)} images)",
+                    data=zip_data,
+                    file_name=ZIP_FILENAME,
+                    mime="application/zip",
+                    use_container_width=True
+                )
         
         # Show preview of renamed files
         with st.expander("👁️ Preview Renamed Files"):
@@ -220,6 +564,8 @@ if st.session_state.processing_complete:
             st.rerun()
     else:
         st.warning("⚠️ No images could be processed. Please check if Tesseract is installed correctly.")
+        if st.session_state.first_error:
+            st.error(f"First error: {st.session_state.first_error}")
         if st.button("🔄 Try Again", use_container_width=True):
             reset_processing()
             st.rerun()
\ No newline at end of file